@@ -1,4 +1,5 @@
 import argparse
+import asyncio
 import logging
 import sys
 import os
@@ -7,13 +8,6 @@ from dotenv import load_dotenv
 # Add the current directory to sys.path to ensure src imports work
 sys.path.append(os.getcwd())
 
-from src.utils import (
-    extract_video_id,
-    get_transcript,
-    get_video_info,
-)
-from src.utils.gemini import ask, SUMMARIZE_PROMPT
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,56 +16,98 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def main():
-    # Load environment variables
-    load_dotenv()
 
-    # Parse arguments
-    parser = argparse.ArgumentParser(description="YouTube Video Summarizer CLI")
-    parser.add_argument("video_url", help="URL of the YouTube video to summarize")
-    args = parser.parse_args()
+async def summarize_one(video_url: str, semaphore: asyncio.Semaphore) -> tuple[str, str] | None:
+    """
+    Summarize a single video, running its blocking steps in worker threads.
+
+    Args:
+        video_url: URL of the YouTube video to summarize.
+        semaphore: Caps how many videos are processed at once.
+
+    Returns:
+        A (title, summary) tuple, or None if the video couldn't be summarized.
+    """
+    # Imported here so `--help` doesn't pay for loading the HTTP/cache stack
+    from src.utils import (
+        extract_video_id,
+        get_transcript,
+        get_video_info,
+    )
+    from src.utils.gemini import ask, build_summary_prompt
+
+    async with semaphore:
+        try:
+            # Step 1: Extract Video ID
+            video_id = extract_video_id(video_url)
+            logger.info(f"[{video_id}] Fetching video info and transcript...")
+
+            # Step 2 & 3: Get Video Info and Transcript concurrently
+            video_info, transcript = await asyncio.gather(
+                asyncio.to_thread(get_video_info, video_id),
+                asyncio.to_thread(get_transcript, video_id),
+            )
+            title = video_info.get("title", "Unknown Title")
+            logger.info(f"[{video_id}] Video Title: {title}")
 
-    video_url = args.video_url
+            # Step 4: Summarize
+            logger.info(f"[{video_id}] Summarizing with Gemini...")
+            prompt = build_summary_prompt(transcript)
+            summary = await asyncio.to_thread(ask, prompt=prompt)
+            return title, summary
 
-    try:
-        # Check API Key
-        if not os.environ.get("ARMY_ACCESS_KEY"):
-            logger.error("ARMY_ACCESS_KEY environment variable is not set.")
-            sys.exit(1)
+        except ValueError as e:
+            logger.error(f"Validation Error ({video_url}): {e}")
+        except Exception as e:
+            logger.error(f"An unexpected error occurred ({video_url}): {e}")
+        return None
 
-        # Step 1: Extract Video ID
-        logger.info("Extracting video ID...")
-        video_id = extract_video_id(video_url)
-        logger.info(f"Video ID: {video_id}")
 
-        # Step 2: Get Video Info
-        logger.info("Fetching video info...")
-        video_info = get_video_info(video_id)
-        title = video_info.get("title", "Unknown Title")
-        logger.info(f"Video Title: {title}")
+async def main_async(video_urls: list[str]) -> bool:
+    """
+    Summarize several videos concurrently, printing each summary as it finishes.
 
-        # Step 3: Get Transcript
-        logger.info("Fetching transcript...")
-        transcript = get_transcript(video_id)
-        logger.info("Transcript fetched successfully.")
+    At most YT_CONCURRENCY videos (default: 8) are processed at once.
 
-        # Step 4: Summarize
-        logger.info("Summarizing with Gemini...")
-        prompt = SUMMARIZE_PROMPT.format(transcript=transcript)
-        summary = ask(prompt=prompt)
+    Returns:
+        True if every video was summarized successfully.
+    """
+    semaphore = asyncio.Semaphore(int(os.environ.get("YT_CONCURRENCY", "8")))
+    tasks = [summarize_one(url, semaphore) for url in video_urls]
+
+    all_ok = True
+    for task in asyncio.as_completed(tasks):
+        result = await task
+        if result is None:
+            all_ok = False
+            continue
 
         # Output
+        title, summary = result
         print("\n" + "="*50)
         print(f"SUMMARY: {title}")
         print("="*50 + "\n")
         print(summary)
         print("\n" + "="*50)
 
-    except ValueError as e:
-        logger.error(f"Validation Error: {e}")
+    return all_ok
+
+
+def main():
+    # Load environment variables
+    load_dotenv()
+
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="YouTube Video Summarizer CLI")
+    parser.add_argument("video_urls", nargs="+", help="URLs of the YouTube videos to summarize")
+    args = parser.parse_args()
+
+    # Check API Key
+    if not os.environ.get("ARMY_ACCESS_KEY"):
+        logger.error("ARMY_ACCESS_KEY environment variable is not set.")
         sys.exit(1)
-    except Exception as e:
-        logger.error(f"An unexpected error occurred: {e}")
+
+    if not asyncio.run(main_async(args.video_urls)):
         sys.exit(1)
 
 if __name__ == "__main__":
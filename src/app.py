@@ -1,22 +1,52 @@
+from contextlib import asynccontextmanager
 from pathlib import Path
-import json
+import asyncio
 
-from fastapi import FastAPI, Request, Form
-from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+import httpx
+import orjson
+from fastapi import Depends, FastAPI, Request, Form
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from sse_starlette import EventSourceResponse
+
+from dotenv import load_dotenv
+
+# Load .env before importing the utilities, which read their settings at import
+load_dotenv()
 
 from src.utils import (
     extract_video_id,
     get_transcript,
     get_video_info,
 )
-from src.utils.gemini import ask, SUMMARIZE_PROMPT
-from dotenv import load_dotenv
+from src.utils.gemini import ask_stream_async, build_summary_prompt
 
-load_dotenv()
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Share one HTTP/2 client (and its connection pool) across requests."""
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        # Generous read timeout: the model can pause between streamed chunks
+        timeout=httpx.Timeout(30.0, read=300.0),
+    )
+    yield
+    await app.state.http.aclose()
+
+
+async def get_http(request: Request) -> httpx.AsyncClient:
+    """Dependency returning the app's shared outbound HTTP client."""
+    return request.app.state.http
+
+
+app = FastAPI(lifespan=lifespan)
+
+# Compress pages, CSS and other large responses. Starlette leaves
+# text/event-stream alone, so SSE events are still flushed immediately.
+app.add_middleware(GZipMiddleware, minimum_size=512)
 
 # Mount static files directory
 app.mount(
@@ -30,48 +60,74 @@ async def home(request: Request):
     return templates.TemplateResponse(request, "index.html")
 
 
-def sse_event(event_type: str, data: dict) -> str:
-    """Format a server-sent event."""
-    return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
+# Pre-encoded SSE framing, so emitting an event is two concatenations
+_SSE_PREFIXES = {
+    event_type: f"event: {event_type}\ndata: ".encode()
+    for event_type in ("progress", "delta", "complete", "error")
+}
+_SSE_END = b"\n\n"
+
+
+def sse_event(event_type: str, data: dict) -> bytes:
+    """Format a server-sent event, JSON-encoding its data with orjson."""
+    return _SSE_PREFIXES[event_type] + orjson.dumps(data) + _SSE_END
 
 
 @app.post("/api/summarize")
-async def summarize(video_url: str = Form(...)):
+async def summarize(
+    request: Request,
+    video_url: str = Form(...),
+    http: httpx.AsyncClient = Depends(get_http),
+):
     """
     Accept a YouTube video URL, fetch captions, and summarize using Gemini.
-    Uses Server-Sent Events to stream progress updates.
+    Uses Server-Sent Events to stream progress updates, then the summary
+    as `delta` events while it's generated.
+
+    Blocking calls run in worker threads so the event loop stays free, and
+    work stops early if the client disconnects between steps.
 
     Args:
+        request: The incoming request, used to detect client disconnects.
         video_url: The YouTube video URL from form data.
+        http: The shared outbound HTTP client.
 
     Returns:
-        StreamingResponse with SSE events for progress and final result.
+        EventSourceResponse with SSE events for progress and final result.
     """
-    
-    def generate_events():
+
+    async def generate_events():
         try:
             # Extract video ID from URL
             video_id = extract_video_id(video_url)
 
-            # Step 1: Fetching video info
+            # Steps 1 & 2: Fetch video info and transcript concurrently
             yield sse_event("progress", {"message": "Fetching video info"})
-            video_info = get_video_info(video_id)
-
-            # Step 2: Fetching transcript
             yield sse_event("progress", {"message": "Fetching video transcript"})
-            transcript = get_transcript(video_id)
+            video_info, transcript = await asyncio.gather(
+                asyncio.to_thread(get_video_info, video_id),
+                asyncio.to_thread(get_transcript, video_id),
+                return_exceptions=True,
+            )
+            # Surface transcript errors first since they're the actionable ones
+            for result in (transcript, video_info):
+                if isinstance(result, Exception):
+                    raise result
+
+            if await request.is_disconnected():
+                return
 
             # Step 3: Summarizing with AI
             yield sse_event("progress", {"message": "Summarizing with AI"})
-            prompt = SUMMARIZE_PROMPT.format(transcript=transcript)
-            summary = ask(prompt=prompt)
+            prompt = build_summary_prompt(transcript)
+            async for chunk in ask_stream_async(http, prompt=prompt):
+                yield sse_event("delta", {"text": chunk})
 
-            # Send complete event with all data
+            # Send complete event with the video details
             yield sse_event("complete", {
                 "video_id": video_id,
                 "video_title": video_info["title"],
                 "thumbnail": video_info["thumbnail"],
-                "summary": summary,
             })
 
         except ValueError as e:
@@ -81,12 +137,4 @@ async def summarize(video_url: str = Form(...)):
             print(f"Unexpected error in summarize: {e}")
             yield sse_event("error", {"error": "An unexpected error occurred"})
 
-    return StreamingResponse(
-        generate_events(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        }
-    )
-
+    return EventSourceResponse(generate_events(), ping=15, sep="\n")
@@ -3,21 +3,41 @@ Utility modules for YouTube video summarizer.
 
 NOTE: OAuth imports are commented out since we use youtube-transcript-api
 which doesn't require authentication.
+
+Submodules are imported lazily on first attribute access (PEP 562), so
+importing this package doesn't pull in the HTTP and cache dependencies.
 """
 
-from .youtube import (
-    get_transcript,
-    get_video_info,
-    get_english_caption_for_video,
-)
-from .general import extract_video_id
+import importlib
 
-__all__ = [
+# Maps each re-exported name to the submodule that defines it
+_EXPORTS = {
     # YouTube
-    "get_transcript",
-    "get_video_info",
-    "get_english_caption_for_video",
+    "get_transcript": ".youtube",
+    "get_transcripts": ".youtube",
+    "get_transcripts_async": ".youtube",
+    "get_video_info": ".youtube",
+    "get_video_title": ".youtube",
+    "get_thumbnail_url": ".youtube",
+    "get_video_infos": ".youtube",
+    "get_video_bundle": ".youtube",
+    "get_english_caption_for_video": ".youtube",
     # General
-    "extract_video_id",
-]
+    "extract_video_id": ".general",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,188 @@
+"""
+Disk cache helpers.
+
+Backed by diskcache, so entries survive restarts and are shared between
+worker processes on the same host. The cache directory defaults to `.cache`
+and can be moved with the YT_CACHE_DIR environment variable (e.g. to /tmp on
+read-only filesystems).
+
+When REDIS_URL is set and the optional redis package is installed, a shared
+Redis layer is also available so multiple workers or hosts can reuse each
+other's results.
+"""
+
+import atexit
+import functools
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from diskcache import Cache
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.environ.get("YT_CACHE_DIR", ".cache")
+REDIS_URL = os.environ.get("REDIS_URL")
+
+
+def _log_stats(name: str, cache: Cache) -> None:
+    """Log the hit/miss counters collected for a cache."""
+    hits, misses = cache.stats()
+    logger.info(f"Cache '{name}': {hits} hits, {misses} misses")
+
+
+def open_cache(name: str) -> Cache | None:
+    """
+    Open a named disk cache under CACHE_DIR.
+
+    Hit/miss statistics are enabled and logged when the process exits.
+
+    Args:
+        name: Sub-directory of CACHE_DIR holding this cache's files.
+
+    Returns:
+        The opened Cache, or None if the cache directory isn't writable.
+    """
+    try:
+        cache = Cache(os.path.join(CACHE_DIR, name))
+    except (OSError, sqlite3.Error) as e:
+        # A read-only directory fails in SQLite rather than in the filesystem
+        logger.warning(f"Disk cache '{name}' disabled: {e}")
+        return None
+
+    cache.stats(enable=True)
+    atexit.register(_log_stats, name, cache)
+    return cache
+
+
+def memoize(cache: Cache | None, expire: float, disable_env: str):
+    """
+    Build a memoizing decorator backed by `cache`.
+
+    Results are keyed by the decorated function's arguments. Exceptions are
+    never cached, so failed lookups are retried on the next call.
+
+    Args:
+        cache: The cache to store results in, as returned by `open_cache`.
+        expire: Seconds until a cached result expires.
+        disable_env: Environment variable that, when set, turns the
+            decorator into a no-op.
+
+    Returns:
+        A decorator for the function to memoize.
+    """
+    if cache is None or os.environ.get(disable_env):
+        return lambda func: func
+
+    return cache.memoize(expire=expire)
+
+
+def ttl_lru_cache(maxsize: int, expire: float, disable_env: str):
+    """
+    Build an in-process LRU cache decorator whose entries expire.
+
+    Like functools.lru_cache, but an entry older than `expire` seconds is
+    recomputed, so the layers behind it (e.g. a `memoize` disk cache)
+    still get a chance to refresh. Exceptions are never cached. Only
+    positional arguments are supported.
+
+    Args:
+        maxsize: Maximum number of entries; the least recently used is evicted.
+        expire: Seconds until an entry expires.
+        disable_env: Environment variable that, when set, turns the
+            decorator into a no-op.
+
+    Returns:
+        A decorator for the function to cache.
+    """
+    if os.environ.get(disable_env):
+        return lambda func: func
+
+    def decorator(func):
+        entries: OrderedDict = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(args)
+                if entry is not None and entry[0] > now:
+                    entries.move_to_end(args)
+                    return entry[1]
+
+            result = func(*args)
+            with lock:
+                entries[args] = (now + expire, result)
+                entries.move_to_end(args)
+                if len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return result
+
+        wrapper.cache_clear = entries.clear
+        return wrapper
+
+    return decorator
+
+
+class RedisCache:
+    """
+    Thin wrapper around a Redis client for shared, best-effort caching.
+
+    Redis errors are logged and treated as cache misses, so an unreachable
+    server slows requests down instead of failing them.
+    """
+
+    def __init__(self, client, errors: type[Exception]):
+        self._client = client
+        self._errors = errors
+
+    def get(self, key: str) -> bytes | None:
+        """Get a value, or None if it's missing or Redis is unavailable."""
+        try:
+            return self._client.get(key)
+        except self._errors as e:
+            logger.warning(f"Redis get failed: {e}")
+            return None
+
+    def mget(self, keys: list[str]) -> list[bytes | None]:
+        """Get several values in a single round trip; misses are None."""
+        if not keys:
+            return []
+        try:
+            return self._client.mget(keys)
+        except self._errors as e:
+            logger.warning(f"Redis mget failed: {e}")
+            return [None] * len(keys)
+
+    def set(self, key: str, value: bytes, expire: int) -> None:
+        """Store a value that expires after `expire` seconds."""
+        try:
+            self._client.set(key, value, ex=expire)
+        except self._errors as e:
+            logger.warning(f"Redis set failed: {e}")
+
+
+def open_redis() -> RedisCache | None:
+    """
+    Connect to the shared Redis cache configured by REDIS_URL.
+
+    The connection is made lazily by redis-py on first use.
+
+    Returns:
+        A RedisCache, or None if REDIS_URL isn't set or redis isn't installed.
+    """
+    if not REDIS_URL:
+        return None
+
+    try:
+        import redis
+    except ImportError:
+        logger.warning("REDIS_URL is set but the redis package isn't installed")
+        return None
+
+    client = redis.Redis.from_url(REDIS_URL, socket_timeout=1, socket_connect_timeout=1)
+    return RedisCache(client, redis.RedisError)
@@ -1,7 +1,17 @@
+import asyncio
+import hashlib
+import json
 import os
+from collections.abc import AsyncIterator
+
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 # from google import genai
 
+from .cache import open_cache
+
 
 # def ask(prompt: str, model: str = "gemini-3-flash-preview") -> str:
 #     """Send a prompt to Gemini and return the response text.
@@ -26,20 +36,54 @@ import requests
 
 GEMINI_ARMY_BASE_URL = "https://gemini-army.vercel.app"
 
+# Shared session so successive calls reuse the keep-alive TLS connection.
+# Gateway errors are retried; the final response is still passed through
+# raise_for_status so its details end up in the error message.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["POST"],
+            raise_on_status=False,
+        ),
+    ),
+)
 
-def ask(prompt: str, model: str = "gemini-3-flash-preview", system_prompt: str = None) -> str:
-    """Send a prompt to the Gemini Army API and return the response text.
+# Responses are cached for 30 days unless LLM_CACHE_DISABLE is set
+LLM_CACHE_EXPIRE = 30 * 24 * 3600
+_llm_cache = None if os.environ.get("LLM_CACHE_DISABLE") else open_cache("llm")
 
-    Args:
-        prompt: The prompt to send to the model
-        model: The Gemini model name to use (default: "gemini-3-flash-preview")
-        system_prompt: Optional system prompt to guide the model's behavior
 
-    Returns:
-        The response text from the model
+def _cache_key(prompt: str, model: str, system_prompt: str | None) -> str:
+    """Hash the inputs that determine a response into a compact cache key."""
+    raw = f"{model}\x00{system_prompt}\x00{prompt}".encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _cached_response(key: str) -> str | None:
+    """Look up a cached response, or None on a miss or if caching is disabled."""
+    if _llm_cache is None:
+        return None
+    return _llm_cache.get(key)
+
+
+def _cache_response(key: str, text: str) -> None:
+    """Cache a non-empty response, if caching is enabled."""
+    if _llm_cache is not None and text:
+        _llm_cache.set(key, text, expire=LLM_CACHE_EXPIRE)
+
+
+def _build_request(prompt: str, model: str, system_prompt: str | None) -> tuple[str, dict, dict]:
+    """Build the URL, headers and JSON payload for a Gemini Army API call.
 
     Raises:
-        ValueError: If ARMY_ACCESS_KEY is not set or API call fails
+        ValueError: If ARMY_ACCESS_KEY environment variable is not set
     """
     api_key = os.environ.get("ARMY_ACCESS_KEY")
     if not api_key:
@@ -59,22 +103,149 @@ def ask(prompt: str, model: str = "gemini-3-flash-preview", system_prompt: str =
     if system_prompt:
         payload["system_prompt"] = system_prompt
 
+    return url, headers, payload
+
+
+def _api_error(e: requests.exceptions.RequestException) -> ValueError:
+    """Turn a failed API request into a ValueError with the response details."""
+    # Try to get more details from the response if possible
+    error_msg = str(e)
+    if hasattr(e, 'response') and e.response is not None:
+        try:
+            error_details = e.response.json()
+            error_msg = f"{e} - Details: {error_details}"
+        except:
+            error_msg = f"{e} - Content: {e.response.text}"
+
+    return ValueError(f"Error calling Gemini Army API: {error_msg}")
+
+
+# SSE fields and comments that carry no text delta
+_SSE_SKIP_PREFIXES = (":", "event:", "id:", "retry:")
+
+
+def _parse_stream_line(line: str) -> str:
+    """Extract the text delta from one line of a streamed API response.
+
+    Handles both newline-delimited JSON and SSE; SSE comments and
+    non-data fields are ignored.
+    """
+    if line.startswith(_SSE_SKIP_PREFIXES):
+        return ""
+    if line.startswith("data:"):
+        line = line[5:].strip()
+    if not line or line == "[DONE]":
+        return ""
+    return _chunk_text(json.loads(line))
+
+
+def _chunk_text(chunk) -> str:
+    """Get the `text` field of a decoded JSON reply, if it has one."""
+    if not isinstance(chunk, dict):
+        return ""
+    return chunk.get("text", "")
+
+
+def ask(prompt: str, model: str = "gemini-3-flash-preview", system_prompt: str = None) -> str:
+    """Send a prompt to the Gemini Army API and return the response text.
+
+    Responses are cached on disk keyed by (model, system_prompt, prompt),
+    so repeating a request skips the API call.
+
+    Args:
+        prompt: The prompt to send to the model
+        model: The Gemini model name to use (default: "gemini-3-flash-preview")
+        system_prompt: Optional system prompt to guide the model's behavior
+
+    Returns:
+        The response text from the model
+
+    Raises:
+        ValueError: If ARMY_ACCESS_KEY is not set or API call fails
+    """
+    url, headers, payload = _build_request(prompt, model, system_prompt)
+
+    key = _cache_key(prompt, model, system_prompt)
+    cached = _cached_response(key)
+    if cached is not None:
+        return cached
+
     try:
-        response = requests.post(url, json=payload, headers=headers)
+        response = _SESSION.post(url, json=payload, headers=headers)
         response.raise_for_status()
         result = response.json()
-        return result.get("text", "")
+        text = result.get("text", "")
     except requests.exceptions.RequestException as e:
-        # Try to get more details from the response if possible
-        error_msg = str(e)
-        if hasattr(e, 'response') and e.response is not None:
-            try:
-                error_details = e.response.json()
-                error_msg = f"{e} - Details: {error_details}"
-            except:
-                error_msg = f"{e} - Content: {e.response.text}"
-        
-        raise ValueError(f"Error calling Gemini Army API: {error_msg}")
+        raise _api_error(e)
+
+    _cache_response(key, text)
+    return text
+
+
+async def ask_stream_async(
+    client: httpx.AsyncClient,
+    prompt: str,
+    model: str = "gemini-3-flash-preview",
+    system_prompt: str = None,
+) -> AsyncIterator[str]:
+    """Send a prompt to the Gemini Army API and yield the response as it's generated.
+
+    The API streams newline-delimited JSON chunks (optionally as SSE
+    `data:` lines), each carrying a `text` delta. A non-streaming reply
+    (served as application/json) is read whole and yielded in one piece,
+    as are cached responses. The full text is cached once the stream
+    completes.
+
+    Args:
+        client: The shared httpx client to send the request with
+        prompt: The prompt to send to the model
+        model: The Gemini model name to use (default: "gemini-3-flash-preview")
+        system_prompt: Optional system prompt to guide the model's behavior
+
+    Yields:
+        Successive pieces of the response text
+
+    Raises:
+        ValueError: If ARMY_ACCESS_KEY is not set or API call fails
+    """
+    url, headers, payload = _build_request(prompt, model, system_prompt)
+    payload["stream"] = True
+
+    # The disk cache is SQLite-backed, so keep its I/O off the event loop
+    key = _cache_key(prompt, model, system_prompt)
+    cached = await asyncio.to_thread(_cached_response, key)
+    if cached is not None:
+        yield cached
+        return
+
+    parts = []
+    try:
+        async with client.stream("POST", url, json=payload, headers=headers) as response:
+            if response.is_error:
+                await response.aread()
+                raise ValueError(
+                    f"Error calling Gemini Army API: {response.status_code} - Content: {response.text}"
+                )
+            content_type = response.headers.get("content-type", "")
+            if content_type.split(";")[0].strip() == "application/json":
+                # A plain JSON reply may span several lines, so parse it whole
+                await response.aread()
+                text = _chunk_text(json.loads(response.content))
+                if text:
+                    parts.append(text)
+                    yield text
+            else:
+                async for line in response.aiter_lines():
+                    text = _parse_stream_line(line)
+                    if text:
+                        parts.append(text)
+                        yield text
+    except httpx.HTTPError as e:
+        raise ValueError(f"Error calling Gemini Army API: {e}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Error calling Gemini Army API: invalid response - {e}")
+
+    await asyncio.to_thread(_cache_response, key, "".join(parts))
 
 
 SUMMARIZE_PROMPT = """
@@ -88,3 +259,26 @@ Your job is to summarize the given YouTube video transcript.
 Transcript:
 {transcript}
 """
+
+# Split once at import so building a prompt is plain concatenation
+_PROMPT_PREFIX, _PROMPT_SUFFIX = SUMMARIZE_PROMPT.split("{transcript}")
+
+# Transcripts longer than this are truncated before being sent to the model
+MAX_TRANSCRIPT_CHARS = int(os.environ.get("MAX_TRANSCRIPT_CHARS", "500000"))
+
+
+def build_summary_prompt(transcript: str) -> str:
+    """Build the summarization prompt for a transcript.
+
+    Transcripts longer than MAX_TRANSCRIPT_CHARS are truncated to bound
+    latency and token cost.
+
+    Args:
+        transcript: The video transcript to summarize
+
+    Returns:
+        The full prompt to send to the model
+    """
+    if len(transcript) > MAX_TRANSCRIPT_CHARS:
+        transcript = transcript[:MAX_TRANSCRIPT_CHARS]
+    return _PROMPT_PREFIX + transcript + _PROMPT_SUFFIX
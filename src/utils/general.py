@@ -3,6 +3,21 @@ General utility functions.
 """
 
 import re
+import socket
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+_DNS_CACHE: dict[tuple, tuple[float, list]] = {}
+_dns_lock = threading.Lock()
+_dns_ttl = 300.0
+
+_VIDEO_ID_RE = re.compile(
+    r"(?:youtube\.com/(?:watch\?v=|embed/|shorts/|live/)|youtu\.be/)([a-zA-Z0-9_-]{11})"
+)
 
 
 def extract_video_id(url: str) -> str:
@@ -13,6 +28,8 @@ def extract_video_id(url: str) -> str:
         - https://www.youtube.com/watch?v=VIDEO_ID
         - https://youtu.be/VIDEO_ID
         - https://www.youtube.com/embed/VIDEO_ID
+        - https://www.youtube.com/shorts/VIDEO_ID
+        - https://www.youtube.com/live/VIDEO_ID
 
     Args:
         url: A YouTube video URL.
@@ -23,15 +40,114 @@ def extract_video_id(url: str) -> str:
     Raises:
         ValueError: If the URL format is not recognized.
     """
-    patterns = [
-        r"(?:youtube\.com\/watch\?v=)([a-zA-Z0-9_-]{11})",
-        r"(?:youtu\.be\/)([a-zA-Z0-9_-]{11})",
-        r"(?:youtube\.com\/embed\/)([a-zA-Z0-9_-]{11})",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    match = _VIDEO_ID_RE.search(url)
+    if match:
+        return match.group(1)
 
     raise ValueError(f"Could not extract video ID from URL: {url}")
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket allowing `rate` calls per `period` seconds.
+
+    Bursts of up to `rate` calls go through immediately; beyond that,
+    `acquire` blocks until a token is available. Fractional rates below one
+    call per period still allow a single call at a time.
+    """
+
+    def __init__(self, rate: float, period: float = 1.0):
+        # A bucket smaller than one token could never fill enough to acquire
+        self.capacity = max(rate, 1)
+        self.fill_rate = rate / period
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a call is allowed, then consume one token."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.fill_rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.fill_rate
+            time.sleep(wait)
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls that share a key into a single call.
+
+    The first caller for a key runs the function; callers arriving while it
+    is still running wait and receive the same result, or the same exception.
+    Once it finishes the key is forgotten, so later calls run again.
+    """
+
+    def __init__(self):
+        self._inflight: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func: Callable[..., T], *args) -> T:
+        """Call `func(*args)`, or wait for an in-progress call with the same key."""
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = func(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+
+def install_dns_cache(ttl: float = 300) -> None:
+    """
+    Cache successful `socket.getaddrinfo` lookups process-wide for `ttl` seconds.
+
+    Clients that resolve through the socket module (requests, sync httpx,
+    and the stdlib asyncio loop's getaddrinfo) then skip DNS when opening
+    a new connection to a recently resolved host. uvloop resolves through
+    libuv, so async clients on a uvloop loop bypass this cache. Failed
+    lookups aren't cached, and expired entries are evicted on insert.
+    Calling this again only changes the TTL.
+    """
+    global _dns_ttl
+    _dns_ttl = ttl
+    if getattr(socket.getaddrinfo, "_dns_cached", False):
+        return
+
+    resolve = socket.getaddrinfo
+
+    def cached_getaddrinfo(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        entry = _DNS_CACHE.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        result = resolve(*args, **kwargs)
+        with _dns_lock:
+            for stale in [k for k, (expires, _) in _DNS_CACHE.items() if expires <= now]:
+                del _DNS_CACHE[stale]
+            _DNS_CACHE[key] = (now + _dns_ttl, result)
+        return result
+
+    cached_getaddrinfo._dns_cached = True
+    socket.getaddrinfo = cached_getaddrinfo
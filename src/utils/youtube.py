@@ -2,82 +2,446 @@
 YouTube utility functions.
 
 Uses youtube-transcript-api for fetching transcripts (works for any public video)
-and YouTube Data API for video metadata.
+and YouTube's oEmbed endpoint for video metadata.
 """
 
+import asyncio
+import atexit
 import os
-from youtube_transcript_api import YouTubeTranscriptApi
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+from youtube_transcript_api import FetchedTranscript, YouTubeTranscriptApi
 from youtube_transcript_api._errors import (
     TranscriptsDisabled,
     NoTranscriptFound,
+    RequestBlocked,
     VideoUnavailable,
 )
 from youtube_transcript_api.proxies import WebshareProxyConfig
 
-from .general import extract_video_id
+from .cache import memoize, open_cache, open_redis, ttl_lru_cache
+from .general import RateLimiter, SingleFlight, extract_video_id, install_dns_cache
 
+_cache = open_cache("youtube")
 
-def _get_transcript_api() -> YouTubeTranscriptApi:
+# Transcripts are effectively immutable, so they're kept for 30 days,
+# zlib-compressed since they're highly redundant text
+TRANSCRIPT_CACHE_EXPIRE = 30 * 24 * 3600
+_transcript_cache = None if os.environ.get("YT_CACHE_DISABLE") else _cache
+
+# Titles are cached for 24 hours. Their oEmbed ETags are kept longer so
+# an expired title can be revalidated instead of re-downloaded.
+TITLE_CACHE_EXPIRE = 24 * 3600
+ETAG_CACHE_EXPIRE = 30 * 24 * 3600
+_etag_cache = None if os.environ.get("YT_CACHE_DISABLE") else _cache
+
+# Titles can change, so the in-process copy is kept much shorter than the
+# shared caches and falls through to them (and ETag revalidation) hourly
+TITLE_MEMORY_EXPIRE = 3600
+
+# Optional Redis layer shared by all workers (see REDIS_URL), consulted
+# after the local caches miss
+_redis = None if os.environ.get("YT_CACHE_DISABLE") else open_redis()
+
+# Transcript languages to try, in order of preference
+DEFAULT_LANGUAGES = ("en", "en-US", "en-GB")
+
+# Shared session so oEmbed lookups reuse pooled keep-alive connections.
+# Like every requests session, it advertises gzip/deflate, plus br when the
+# brotli package is installed, and transparently decompresses responses.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=100))
+atexit.register(_SESSION.close)
+
+# Opt-in process-wide DNS cache (YT_DNS_CACHE_TTL seconds, e.g. 300), so
+# new requests connections to YouTube hosts (oEmbed and the transcript
+# API) skip the lookup. It doesn't cover async httpx under uvloop, which
+# resolves through libuv. Off by default since it also applies to every
+# other host the process resolves.
+_DNS_CACHE_TTL = float(os.environ.get("YT_DNS_CACHE_TTL", "0"))
+if _DNS_CACHE_TTL > 0:
+    install_dns_cache(_DNS_CACHE_TTL)
+
+# Bound str.format methods for the fixed URL templates
+_THUMB = "https://img.youtube.com/vi/{}/hqdefault.jpg".format
+_OEMBED = "https://www.youtube.com/oembed?url=https://www.youtube.com/watch?v={}&format=json".format
+
+# Fetches per second to YouTube (transcript fetches and oEmbed lookups
+# combined), kept under its throttling threshold. A transcript fetch makes
+# several HTTP requests, so this isn't a per-request limit. Set
+# YT_RATE_LIMIT=0 to disable.
+_YT_RATE_LIMIT = float(os.environ.get("YT_RATE_LIMIT", "10"))
+_LIMITER = RateLimiter(_YT_RATE_LIMIT) if _YT_RATE_LIMIT > 0 else None
+
+
+# Concurrent lookups of the same video share one fetch instead of each
+# hitting YouTube
+_inflight = SingleFlight()
+
+
+def _throttle() -> None:
+    """Wait for the YouTube rate limiter, if enabled."""
+    if _LIMITER is not None:
+        _LIMITER.acquire()
+
+
+def _load_proxy_config() -> WebshareProxyConfig | None:
     """
-    Get a YouTubeTranscriptApi instance, optionally configured with Webshare proxy.
+    Build the Webshare proxy config from the environment, if configured.
 
     If WEBSHARE_USERNAME and WEBSHARE_PASSWORD environment variables are set,
-    the API will use Webshare rotating residential proxies to avoid IP bans.
+    transcript requests will use Webshare rotating residential proxies to
+    avoid IP bans.
 
     Returns:
-        A configured YouTubeTranscriptApi instance.
+        A WebshareProxyConfig, or None if no credentials are set.
     """
     webshare_username = os.environ.get("WEBSHARE_USERNAME")
     webshare_password = os.environ.get("WEBSHARE_PASSWORD")
 
     if webshare_username and webshare_password:
-        proxy_config = WebshareProxyConfig(
+        return WebshareProxyConfig(
             proxy_username=webshare_username,
             proxy_password=webshare_password,
         )
-        return YouTubeTranscriptApi(proxy_config=proxy_config)
+    return None
+
+
+# Built once and shared by every thread's API instance. Webshare rotates
+# the exit IP per connection, so the library deliberately sends
+# "Connection: close" through it; a bigger connection pool wouldn't be used.
+_PROXY_CONFIG = _load_proxy_config()
+
+
+def _build_transcript_api() -> YouTubeTranscriptApi:
+    """
+    Build a YouTubeTranscriptApi instance, optionally configured with Webshare proxy.
+
+    Returns:
+        A configured YouTubeTranscriptApi instance.
+    """
+    return YouTubeTranscriptApi(proxy_config=_PROXY_CONFIG)
+
+
+_thread_local = threading.local()
+
+
+def _get_transcript_api() -> YouTubeTranscriptApi:
+    """
+    Get this thread's YouTubeTranscriptApi instance, building it on first use.
+
+    Reusing the instance keeps its requests.Session, and the pooled
+    connections to youtube.com, alive between fetches. Instances are kept
+    per thread because YouTubeTranscriptApi isn't thread-safe.
+
+    Returns:
+        A configured YouTubeTranscriptApi instance.
+    """
+    api = getattr(_thread_local, "transcript_api", None)
+    if api is None:
+        api = _thread_local.transcript_api = _build_transcript_api()
+    return api
+
+
+@retry(
+    retry=retry_if_exception_type(RequestBlocked),
+    stop=stop_after_attempt(5),
+    wait=wait_exponential_jitter(initial=1, max=30),
+    reraise=True,
+)
+def _fetch_with_retry(api: YouTubeTranscriptApi, video_id: str, languages: tuple[str, ...]) -> FetchedTranscript:
+    """
+    Fetch a transcript, backing off and retrying while YouTube throttles us.
 
-    return YouTubeTranscriptApi()
+    Only RequestBlocked (which includes IpBlocked) is retried; errors such as
+    TranscriptsDisabled or NoTranscriptFound are raised immediately.
+    Every attempt waits for the rate limiter.
+    """
+    _throttle()
+    return api.fetch(video_id, languages=languages)
 
 
-def get_transcript(video_id: str, languages: list[str] = ["en"]) -> str:
+def get_transcript(video_id: str, languages: tuple[str, ...] = DEFAULT_LANGUAGES) -> str:
     """
     Fetch the transcript for a YouTube video.
 
     Uses youtube-transcript-api which works for any public video
-    without requiring OAuth authentication.
+    without requiring OAuth authentication. Results are cached per video ID
+    and language list for 30 days: in an in-process LRU, on disk and, if
+    REDIS_URL is set, in Redis. YT_CACHE_DISABLE turns all of them off.
 
     If WEBSHARE_USERNAME and WEBSHARE_PASSWORD environment variables are set,
     requests will be proxied through Webshare to avoid IP bans on cloud platforms.
 
+    Language fallback costs no extra requests: the video's transcript list
+    is fetched once and the first available language is picked from it.
+    Concurrent calls for the same video and languages share one fetch.
+
     Args:
         video_id: The YouTube video ID.
-        languages: List of language codes to try (default: ['en']).
+        languages: Language codes to try, in order of preference
+            (default: ('en', 'en-US', 'en-GB')).
 
     Returns:
         The transcript as a plain text string.
 
     Raises:
-        ValueError: If no transcript is available for the video.
+        ValueError: If no transcript is available for the video, or YouTube
+            is still blocking requests after retrying.
+    """
+    # Normalize so list and tuple arguments share cache entries
+    languages = tuple(languages)
+    return _inflight.do(_transcript_key(video_id, languages), _get_transcript, video_id, languages)
+
+
+def _transcript_key(video_id: str, languages: tuple[str, ...]) -> str:
+    """Cache key shared by the disk and Redis transcript caches."""
+    return f"transcript:{video_id}:{','.join(languages)}"
+
+
+def _load_cached_transcript(key: str) -> bytes | None:
     """
+    Look up a compressed transcript on disk, then in Redis.
+
+    Redis hits are copied to the disk cache so later lookups stay local.
+    """
+    if _transcript_cache is not None:
+        compressed = _transcript_cache.get(key)
+        if compressed is not None:
+            return compressed
+
+    if _redis is None:
+        return None
+    compressed = _redis.get(key)
+    if compressed is not None and _transcript_cache is not None:
+        _transcript_cache.set(key, compressed, expire=TRANSCRIPT_CACHE_EXPIRE)
+    return compressed
+
+
+def _store_transcript(key: str, compressed: bytes) -> None:
+    """Save a compressed transcript to the disk and Redis caches."""
+    if _transcript_cache is not None:
+        _transcript_cache.set(key, compressed, expire=TRANSCRIPT_CACHE_EXPIRE)
+    if _redis is not None:
+        _redis.set(key, compressed, expire=TRANSCRIPT_CACHE_EXPIRE)
+
+
+@ttl_lru_cache(maxsize=1024, expire=TRANSCRIPT_CACHE_EXPIRE, disable_env="YT_CACHE_DISABLE")
+def _get_transcript(video_id: str, languages: tuple[str, ...]) -> str:
+    """Cached implementation of `get_transcript`."""
+    key = _transcript_key(video_id, languages)
+    compressed = _load_cached_transcript(key)
+    if compressed is not None:
+        return zlib.decompress(compressed).decode()
+
     try:
         api = _get_transcript_api()
-        transcript = api.fetch(video_id, languages=languages)
-        # Combine all segments into a single text
-        return " ".join(segment.text for segment in transcript)
+        transcript = _fetch_with_retry(api, video_id, languages)
+        # Combine all segments into a single text. attrgetter keeps the
+        # attribute lookups in C, and a list lets join size the result in one pass.
+        text = " ".join(list(map(attrgetter("text"), transcript)))
     except TranscriptsDisabled:
         raise ValueError("Transcripts are disabled for this video")
     except NoTranscriptFound:
-        raise ValueError(f"No transcript found in languages: {languages}")
+        raise ValueError(f"No transcript found in languages: {list(languages)}")
     except VideoUnavailable:
         raise ValueError("Video is unavailable")
+    except RequestBlocked:
+        raise ValueError("YouTube is rate limiting transcript requests, please try again later")
+
+    _store_transcript(key, zlib.compress(text.encode()))
+    return text
+
+
+async def get_transcript_async(video_id: str, languages: tuple[str, ...] = DEFAULT_LANGUAGES) -> str:
+    """
+    Async version of `get_transcript`.
+
+    youtube-transcript-api has no async client, so the fetch runs in a
+    worker thread and the event loop stays free while it waits on YouTube.
+
+    Args:
+        video_id: The YouTube video ID.
+        languages: Language codes to try, in order of preference.
+
+    Returns:
+        The transcript as a plain text string.
+
+    Raises:
+        ValueError: If no transcript is available for the video.
+    """
+    return await asyncio.to_thread(get_transcript, video_id, languages)
+
+
+async def get_transcripts_async(
+    video_ids: list[str],
+    languages: tuple[str, ...] = DEFAULT_LANGUAGES,
+    concurrency: int = 16,
+) -> list[str | Exception]:
+    """
+    Fetch transcripts for several videos concurrently.
+
+    Fetches run on a thread pool of their own, sized to `concurrency`, so
+    the limit holds regardless of the event loop's default executor.
+
+    Args:
+        video_ids: The YouTube video IDs.
+        languages: Language codes to try, in order of preference.
+        concurrency: Maximum number of transcripts fetched at once.
+
+    Returns:
+        One entry per video ID, in order: the transcript text, or the
+        exception raised while fetching it.
+    """
+    languages = tuple(languages)
+    cached = await asyncio.to_thread(_prefetch_transcripts, video_ids, languages)
+    loop = asyncio.get_running_loop()
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="yt-transcripts")
+
+    async def fetch_one(video_id: str) -> str:
+        if video_id in cached:
+            return cached[video_id]
+        return await loop.run_in_executor(executor, get_transcript, video_id, languages)
+
+    try:
+        return await asyncio.gather(
+            *(fetch_one(video_id) for video_id in video_ids),
+            return_exceptions=True,
+        )
+    finally:
+        # Don't block the event loop joining the workers, e.g. on cancellation
+        executor.shutdown(wait=False)
+
+
+def _prefetch_transcripts(video_ids: list[str], languages: tuple[str, ...]) -> dict[str, str]:
+    """
+    Look up several transcripts in Redis with a single MGET.
+
+    Returns:
+        A dictionary mapping each video ID found in Redis to its transcript.
+    """
+    if _redis is None:
+        return {}
+
+    unique_ids = list(dict.fromkeys(video_ids))
+    values = _redis.mget([_transcript_key(video_id, languages) for video_id in unique_ids])
+    return {
+        video_id: zlib.decompress(compressed).decode()
+        for video_id, compressed in zip(unique_ids, values)
+        if compressed is not None
+    }
+
+
+def get_transcripts(
+    video_ids: list[str],
+    languages: tuple[str, ...] = DEFAULT_LANGUAGES,
+    concurrency: int = 16,
+) -> list[str | Exception]:
+    """
+    Synchronous facade over `get_transcripts_async` for non-async callers.
+
+    Must not be called from a running event loop.
+    """
+    return asyncio.run(get_transcripts_async(video_ids, languages, concurrency))
+
+
+@ttl_lru_cache(maxsize=4096, expire=TITLE_MEMORY_EXPIRE, disable_env="YT_CACHE_DISABLE")
+@memoize(_cache, expire=TITLE_CACHE_EXPIRE, disable_env="YT_CACHE_DISABLE")
+def _fetch_video_title(video_id: str) -> str:
+    """
+    Fetch a video's title from YouTube's oEmbed endpoint (no auth required).
+
+    Results are cached on disk and, if configured, in Redis for 24 hours,
+    with an in-process LRU in front that keeps each title for up to an
+    hour. Failures raise instead of returning a fallback so they never
+    end up in any cache.
+
+    The response's ETag is kept on disk for 30 days, so once the cached
+    title expires it's revalidated with If-None-Match; a 304 reuses the
+    stored title without transferring a body.
+    """
+    redis_key = f"title:{video_id}"
+    if _redis is not None:
+        cached = _redis.get(redis_key)
+        if cached is not None:
+            return cached.decode()
+
+    etag_key = f"oembed-etag:{video_id}"
+    validator = _etag_cache.get(etag_key) if _etag_cache is not None else None
+    headers = {"If-None-Match": validator[0]} if validator else None
+
+    _throttle()
+    response = _SESSION.get(_OEMBED(video_id), headers=headers, timeout=5)
+    if response.status_code == 304 and validator:
+        title = validator[1]
+    else:
+        response.raise_for_status()
+        # Parse the raw bytes directly; an invalid body raises orjson.JSONDecodeError
+        title = orjson.loads(response.content).get("title", "")
+
+        etag = response.headers.get("ETag")
+        if etag and _etag_cache is not None:
+            _etag_cache.set(etag_key, (etag, title), expire=ETAG_CACHE_EXPIRE)
+
+    if _redis is not None:
+        _redis.set(redis_key, title.encode(), expire=TITLE_CACHE_EXPIRE)
+    return title
+
+
+def get_thumbnail_url(video_id: str) -> str:
+    """
+    Get the high-quality thumbnail URL for a video.
+
+    The URL follows a fixed pattern that works for all public videos, so
+    no request is made.
+
+    Args:
+        video_id: The YouTube video ID.
+
+    Returns:
+        The thumbnail image URL.
+    """
+    return _THUMB(video_id)
+
+
+def get_video_title(video_id: str) -> str:
+    """
+    Fetch a video's title.
+
+    Uses YouTube's oEmbed endpoint which doesn't require authentication.
+    Concurrent calls for the same video share one request.
+
+    Args:
+        video_id: The YouTube video ID.
+
+    Returns:
+        The video title, or an empty string if it couldn't be fetched.
+    """
+    try:
+        return _inflight.do(f"title:{video_id}", _fetch_video_title, video_id)
+    except Exception:
+        return ""
 
 
 def get_video_info(video_id: str) -> dict:
     """
     Fetch video title and thumbnail for a given video ID.
 
-    Uses YouTube's oEmbed endpoint which doesn't require authentication.
+    Only the title requires a request; use `get_thumbnail_url` directly
+    when the title isn't needed.
 
     Args:
         video_id: The YouTube video ID.
@@ -85,20 +449,64 @@ def get_video_info(video_id: str) -> dict:
     Returns:
         A dictionary with 'title' and 'thumbnail' keys.
     """
-    # Use high-quality thumbnail URL pattern (works for all public videos)
-    thumbnail_url = f"https://img.youtube.com/vi/{video_id}/hqdefault.jpg"
+    return {"title": get_video_title(video_id), "thumbnail": get_thumbnail_url(video_id)}
 
-    # For title, we can use oEmbed API (no auth required)
-    import urllib.request
-    import json
 
-    try:
-        oembed_url = f"https://www.youtube.com/oembed?url=https://www.youtube.com/watch?v={video_id}&format=json"
-        with urllib.request.urlopen(oembed_url) as response:
-            data = json.loads(response.read().decode())
-            return {"title": data.get("title", ""), "thumbnail": thumbnail_url}
-    except Exception:
-        return {"title": "", "thumbnail": thumbnail_url}
+def get_video_infos(video_ids: list[str], max_workers: int = 32) -> dict[str, dict]:
+    """
+    Fetch video info for several videos concurrently.
+
+    Lookups run in a thread pool over the shared keep-alive session, so
+    N videos cost roughly N / max_workers round-trips instead of N.
+
+    Args:
+        video_ids: The YouTube video IDs. Duplicates are fetched once.
+        max_workers: Maximum number of concurrent lookups.
+
+    Returns:
+        A dictionary mapping each video ID to its `get_video_info` result.
+    """
+    unique_ids = list(dict.fromkeys(video_ids))
+    if not unique_ids:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_ids))) as executor:
+        futures = {
+            video_id: executor.submit(get_video_info, video_id)
+            for video_id in unique_ids
+        }
+        return {video_id: future.result() for video_id, future in futures.items()}
+
+
+# Long-lived workers for get_video_bundle, so each thread's transcript API
+# instance (and its warm connections) is reused across calls
+_BUNDLE_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="yt-bundle")
+
+
+def get_video_bundle(video_url: str) -> dict:
+    """
+    Fetch a video's transcript, title and thumbnail in one call.
+
+    The transcript and the video info are fetched concurrently, so this
+    takes as long as the slower of the two rather than their sum.
+
+    Args:
+        video_url: A YouTube video URL.
+
+    Returns:
+        A dictionary with 'video_id', 'transcript', 'title' and 'thumbnail' keys.
+
+    Raises:
+        ValueError: If the video ID can't be extracted or no transcript is available.
+    """
+    video_id = extract_video_id(video_url)
+    transcript_future = _BUNDLE_EXECUTOR.submit(get_transcript, video_id)
+    info_future = _BUNDLE_EXECUTOR.submit(get_video_info, video_id)
+    return {
+        "video_id": video_id,
+        "transcript": transcript_future.result(),
+        **info_future.result(),
+    }
 
 
 def get_english_caption_for_video(video_url: str) -> str | None: